@@ -12,33 +12,79 @@ https://www.megamillions.com/How-to-Play.aspx
 import logging
 import os
 import random
-from dataclasses import dataclass
-from typing import Tuple, List, TypeAlias, Dict
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+from typing import Callable, Tuple, List, TypeAlias
+
+import numpy as np
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-@dataclass
-class WinData:
-    """
-    Stores win statistics for a specific prize tier.
-
-    Attributes:
-        count (int): Number of winning tickets in this tier
-        prize (int): Prize amount for this tier in dollars
-        total (int): Total winnings for this tier
-        odds (float): Probability of winning this tier (1/odds)
-    """
-    count: int = 0
-    prize: int = 0
-    total: int = 0
-    odds: float = 0.0
-
-
 # Type aliases for improved code readability
-TicketNumbers: TypeAlias = Tuple[List[int], int]  # (white_balls, mega_ball)
-WinSummary: TypeAlias = Dict[str, WinData]  # Maps prize tier to win data
+TicketNumbers: TypeAlias = Tuple[int, int]  # (white_ball_mask, mega_ball)
+
+# Prize tier for each match index ``white_matches * 2 + mega_match``
+# (None for combinations that do not win anything)
+MATCH_KEYS: List[str | None] = [
+    None, "Mega Ball only",
+    None, "1 + Mega Ball",
+    None, "2 + Mega Ball",
+    "3", "3 + Mega Ball",
+    "4", "4 + Mega Ball",
+    "5", "5 + Mega Ball",
+]
+
+# Match index of each prize tier in display order (jackpot first)
+TIER_MATCH_INDEX = np.array([index for index in reversed(range(len(MATCH_KEYS)))
+                             if MATCH_KEYS[index] is not None])
+TIER_NAMES: List[str] = [key for key in reversed(MATCH_KEYS) if key is not None]
+
+JACKPOT_AMOUNT = 1_000_000_000  # Default jackpot of $1 billion
+
+# Prize amount in dollars for each match index, per official Mega Millions rules
+PRIZE_LUT = array("q", [
+    0, 2,
+    0, 4,
+    0, 10,
+    10, 200,
+    500, 10_000,
+    1_000_000, JACKPOT_AMOUNT,
+])
+
+# Probability of each match index per official Mega Millions odds (0 for non-winning slots)
+ODDS_LUT = array("d", [
+    0, 1 / 37,
+    0, 1 / 89,
+    0, 1 / 693,
+    1 / 606, 1 / 14547,
+    1 / 38792, 1 / 931001,
+    1 / 12607306, 1 / 302575350,
+])
+
+# Number of tickets drawn per vectorized chunk, shared between all worker processes
+# to bound peak memory use
+BATCH_SIZE = 100_000
+
+# Smallest simulation worth importing Numba and loading the compiled simulation loop for
+COMPILED_MIN_TICKETS = 1_000_000
+
+# Smallest simulation worth splitting across worker processes, by simulation path.
+# Starting a worker costs about 0.1s when forked and about 1s when spawned (NumPy
+# and Numba imports plus the kernel cache load), so the pool only pays off once a
+# single process needs several seconds: measured at ~1M tickets/s with NumPy and
+# ~6M tickets/s with the compiled loop.
+PARALLEL_MIN_TICKETS = 1_000_000
+PARALLEL_MIN_COMPILED_TICKETS = 20_000_000
+
+# Probability analysis table layout
+_SEPARATOR = "-" * 95
+_HEADER = f"{'Match Type':<15} {'Expected':<10} {'Actual':<10} {'Diff %':<10} {'Within 2σ':<10}"
+_ROW_FORMAT = "{:<15} {:>9.1f} {:>9} {:>9.1f}% {:>9}"
 
 
 class MegaMillions:
@@ -49,79 +95,132 @@ class MegaMillions:
     Different prize tiers exist based on matching combinations.
     """
 
-    JACKPOT_AMOUNT = 1_000_000_000  # Default jackpot of $1 billion
+    __slots__ = ("ticket_cost", "_rand", "_pool", "_winning_mask", "_winning_mega")
+
+    JACKPOT_AMOUNT = JACKPOT_AMOUNT
     DEFAULT_TICKET_COST = 2.00
     WHITE_BALL_MAX = 71  # Range is 1-70
     MEGA_BALL_MAX = 26  # Range is 1-25
+    # White ball numbers, built once for the class rather than per instance
+    white_ball_range = tuple(range(1, WHITE_BALL_MAX))
 
     def __init__(self) -> None:
         """Initialize game parameters and ticket cost."""
-        self.white_ball_range = range(1, self.WHITE_BALL_MAX)
-        self.mega_ball_range = range(1, self.MEGA_BALL_MAX)
         self.ticket_cost = self.DEFAULT_TICKET_COST
+        # Dedicated generator, so draws skip the random module's shared instance
+        self._rand = random.Random(os.urandom(16))
+        # Scratch pool of white balls, partially shuffled in place for each draw
+        self._pool = bytearray(self.white_ball_range)
+        # Winning numbers tickets are checked against, cached by set_winning
+        self._winning_mask: int | None = None
+        self._winning_mega: int | None = None
 
     def generate_numbers(self) -> TicketNumbers:
         """
         Generate a random set of lottery numbers.
 
+        The white balls are drawn with a partial Fisher-Yates shuffle of the
+        instance's ball pool and packed into a single integer bitmask where
+        bit ``n`` is set iff ball ``n`` was drawn, so matches can be counted
+        with one AND and a popcount.
+
         Returns:
             Tuple containing:
-                - List of 5 sorted white ball numbers (1-70)
+                - Bitmask of the 5 white ball numbers (1-70)
                 - Single Mega Ball number (1-25)
+        """
+        pool = self._pool
+        randrange = self._rand.randrange
+        white_mask = 0
+        for i in range(5):
+            j = i + randrange(len(pool) - i)
+            pool[i], pool[j] = pool[j], pool[i]
+            white_mask |= 1 << pool[i]
+        mega_ball = randrange(1, self.MEGA_BALL_MAX)
+        return white_mask, mega_ball
+
+    @staticmethod
+    def white_balls(white_mask: int) -> List[int]:
+        """
+        Decode a white ball bitmask into its sorted ball numbers.
+
+        Set bits are peeled off lowest first, so the numbers come out in
+        ascending order without a sort and only drawn balls are visited.
+
+        Args:
+            white_mask: Bitmask as produced by generate_numbers
+
+        Returns:
+            List of white ball numbers in ascending order
+        """
+        balls = []
+        while white_mask:
+            lowest = white_mask & -white_mask
+            balls.append(lowest.bit_length() - 1)
+            white_mask ^= lowest
+        return balls
+
+    def set_winning(self, winning_numbers: TicketNumbers) -> None:
+        """
+        Set the winning numbers that tickets are checked against.
+
+        Must be called before match_index, check_win or get_match_description.
+
+        Args:
+            winning_numbers: The winning numbers for the draw
+        """
+        self._winning_mask, self._winning_mega = winning_numbers
+
+    def match_index(self, ticket: TicketNumbers) -> int:
+        """
+        Compute the match index of a ticket against the winning numbers.
+
+        The index is ``white_matches * 2 + mega_match`` and selects the
+        ticket's entry in PRIZE_LUT and MATCH_KEYS.
+
+        Args:
+            ticket: The player's ticket numbers
+
+        Returns:
+            Match index in the range 0-11
 
         Raises:
-            ValueError: If number generation fails
+            RuntimeError: If set_winning has not been called
         """
-        try:
-            white_balls = sorted(random.sample(self.white_ball_range, 5))
-            mega_ball = random.choice(self.mega_ball_range)
-            return white_balls, mega_ball
-        except ValueError as e:
-            raise ValueError("Failed to generate numbers") from e
+        if self._winning_mask is None:
+            raise RuntimeError("set_winning must be called before checking tickets")
+        white_matches = (ticket[0] & self._winning_mask).bit_count()
+        return white_matches * 2 + (ticket[1] == self._winning_mega)
 
-    @staticmethod
-    def check_win(ticket: TicketNumbers, winning_numbers: TicketNumbers) -> int:
+    def check_win(self, ticket: TicketNumbers) -> int:
         """
         Check if a ticket wins and determine prize amount.
 
         Args:
             ticket: The player's ticket numbers
-            winning_numbers: The winning numbers for the draw
 
         Returns:
             Prize amount in dollars (0 if no win)
+
+        Raises:
+            RuntimeError: If set_winning has not been called
         """
-        white_matches = len(set(ticket[0]) & set(winning_numbers[0]))
-        mega_matches = ticket[1] == winning_numbers[1]
-
-        # Prize structure based on official Mega Millions rules
-        prize_structure = {
-            (5, True): 1_000_000_000,
-            (5, False): 1_000_000,
-            (4, True): 10_000,
-            (4, False): 500,
-            (3, True): 200,
-            (3, False): 10,
-            (2, True): 10,
-            (1, True): 4,
-            (0, True): 2,
-        }
-        return prize_structure.get((white_matches, mega_matches), 0)
+        return PRIZE_LUT[self.match_index(ticket)]
 
-    @staticmethod
-    def get_match_description(ticket: TicketNumbers, winning_numbers: TicketNumbers) -> str:
+    def get_match_description(self, ticket: TicketNumbers) -> str:
         """
         Generate a human-readable description of how the ticket matched.
 
         Args:
             ticket: The player's ticket numbers
-            winning_numbers: The winning numbers for the draw
 
         Returns:
             String describing the matches (e.g., "3 numbers + Mega Ball")
+
+        Raises:
+            RuntimeError: If set_winning has not been called
         """
-        white_matches = len(set(ticket[0]) & set(winning_numbers[0]))
-        mega_matches = ticket[1] == winning_numbers[1]
+        white_matches, mega_matches = divmod(self.match_index(ticket), 2)
 
         return (
             "Mega Ball only" if white_matches == 0 and mega_matches else
@@ -130,76 +229,243 @@ class MegaMillions:
         )
 
 
-def initialize_win_summary() -> WinSummary:
+def tier_odds() -> np.ndarray:
     """
-    Initialize the win summary with default values and official odds.
+    Look up the official odds of each prize tier.
 
     Returns:
-        Dictionary mapping prize tiers to their WinData objects
+        Probability of winning each tier, in the order of TIER_NAMES
     """
-    return {
-        "5 + Mega Ball": WinData(prize=MegaMillions.JACKPOT_AMOUNT, odds=1 / 302575350),
-        "5": WinData(prize=1_000_000, odds=1 / 12607306),
-        "4 + Mega Ball": WinData(prize=10_000, odds=1 / 931001),
-        "4": WinData(prize=500, odds=1 / 38792),
-        "3 + Mega Ball": WinData(prize=200, odds=1 / 14547),
-        "3": WinData(prize=10, odds=1 / 606),
-        "2 + Mega Ball": WinData(prize=10, odds=1 / 693),
-        "1 + Mega Ball": WinData(prize=4, odds=1 / 89),
-        "Mega Ball only": WinData(prize=2, odds=1 / 37)
-    }
+    return np.frombuffer(ODDS_LUT, dtype=np.float64)[TIER_MATCH_INDEX]
 
 
-def print_summary(num_tickets: int, total_spent: float, total_won: int) -> None:
+def build_winning_lut(white_mask: int) -> np.ndarray:
     """
-    Print a summary of the simulation results.
+    Build the winning-number lookup table used by the simulation loops.
+
+    The table is indexed by ball number and holds 2 for each drawn white
+    ball, else 0. Summing it over a ticket's white balls gives
+    ``white_matches * 2`` directly, so adding the Mega Ball match yields the
+    match index without a separate multiply.
 
     Args:
-        num_tickets: Number of tickets played
-        total_spent: Total money spent on tickets
-        total_won: Total prize money won
+        white_mask: Winning white ball bitmask as produced by generate_numbers
+
+    Returns:
+        Lookup table with one int8 entry per ball number
+    """
+    winning_lut = np.zeros(MegaMillions.WHITE_BALL_MAX, dtype=np.int8)
+    winning_lut[MegaMillions.white_balls(white_mask)] = 2
+    return winning_lut
+
+
+def _simulate_vectorized(num_tickets: int, winning_lut: np.ndarray, winning_mega: int,
+                         rng: np.random.Generator, counts: np.ndarray,
+                         chunk_size: int = BATCH_SIZE) -> None:
+    """
+    Play tickets with vectorized NumPy operations, accumulating into counts.
+
+    Tickets are processed in chunks of chunk_size to bound peak memory use,
+    drawing all random values for a chunk in one call per ball type.
+
+    Args:
+        num_tickets: Number of tickets to play
+        winning_lut: 2 for each drawn white ball number, else 0
+        winning_mega: The winning Mega Ball number
+        rng: Random number generator to draw tickets from
+        counts: Number of tickets per match index, updated in place
+        chunk_size: Number of tickets drawn per chunk
     """
-    print(f"\nResults Summary:\n"
-          f"Total tickets purchased: {num_tickets}\n"
-          f"Total spent: ${total_spent:.2f}\n"
-          f"Total won: ${total_won:,}\n"
-          f"Net profit/loss: ${(total_won - total_spent):,.2f}\n"
-          f"Return on spend: {(total_won / total_spent * 100):.2f}%")
+    white_count = MegaMillions.WHITE_BALL_MAX - 1
 
+    for start in range(0, num_tickets, chunk_size):
+        size = min(chunk_size, num_tickets - start)
+        # The 5 smallest of 70 uniform keys per row give a sample without replacement
+        whites = np.argpartition(rng.random((size, white_count)), 5, axis=1)[:, :5] + 1
+        megas = rng.integers(1, MegaMillions.MEGA_BALL_MAX, size=size, dtype=np.int8)
 
-def print_probability_analysis(win_summary: WinSummary, num_tickets: int) -> None:
+        # Unrolled over the 5 columns: avoids a (size, 5) temporary and a short-axis reduction
+        match_index = (winning_lut[whites[:, 0]] + winning_lut[whites[:, 1]]
+                       + winning_lut[whites[:, 2]] + winning_lut[whites[:, 3]]
+                       + winning_lut[whites[:, 4]])
+        match_index += megas == winning_mega
+        counts += np.bincount(match_index, minlength=len(MATCH_KEYS))
+
+
+def _simulate_compiled(num_tickets: int, winning_lut: np.ndarray, winning_mega: int,
+                       mega_ball_max: int, seed: int, counts: np.ndarray) -> None:
     """
-    Print statistical analysis comparing actual vs expected wins.
+    Play tickets one at a time in a loop compiled by Numba, accumulating into counts.
+
+    Each ticket is drawn with a partial Fisher-Yates shuffle of a reusable
+    pool of white balls, so no memory is allocated per ticket.
 
     Args:
-        win_summary: Dictionary containing win data for each prize tier
-        num_tickets: Number of tickets played
+        num_tickets: Number of tickets to play
+        winning_lut: 2 for each drawn white ball number, else 0
+        winning_mega: The winning Mega Ball number
+        mega_ball_max: One past the highest Mega Ball number
+        seed: Seed for Numba's random number generator
+        counts: Number of tickets per match index, updated in place
+    """
+    np.random.seed(seed)
+    white_count = winning_lut.shape[0] - 1
+    pool = np.arange(1, white_count + 1)
+
+    for _ in range(num_tickets):
+        match_index = 0
+        for i in range(5):
+            j = np.random.randint(i, white_count)
+            pool[i], pool[j] = pool[j], pool[i]
+            match_index += winning_lut[pool[i]]
+        if np.random.randint(1, mega_ball_max) == winning_mega:
+            match_index += 1
+        counts[match_index] += 1
+
+
+@lru_cache(maxsize=None)
+def _load_compiled() -> Callable[..., None] | None:
+    """
+    Compile the simulation loop with Numba on first use.
+
+    Numba is imported lazily so small simulations never pay for it. The loop
+    is run once on an empty batch so the native code is loaded before any
+    worker processes are forked, rather than once per worker.
+
+    Returns:
+        The compiled simulation loop, or None if Numba is not installed
+    """
+    try:
+        from numba import njit
+    except ImportError:  # Numba is optional; fall back to the NumPy implementation
+        return None
+    compiled = njit(cache=True)(_simulate_compiled)
+    compiled(0, np.zeros(MegaMillions.WHITE_BALL_MAX, dtype=np.int8), 0,
+             MegaMillions.MEGA_BALL_MAX, 0, np.zeros(len(MATCH_KEYS), dtype=np.int64))
+    return compiled
+
+
+def simulate_batch(num_tickets: int, winning_lut: np.ndarray, winning_mega: int,
+                   seed_seq: np.random.SeedSequence, compiled: bool = False,
+                   chunk_size: int = BATCH_SIZE) -> np.ndarray:
+    """
+    Play a batch of random tickets in the current process.
+
+    Args:
+        num_tickets: Number of tickets to play
+        winning_lut: 2 for each drawn white ball number, else 0
+        winning_mega: The winning Mega Ball number
+        seed_seq: Seed for this batch's random number generator
+        compiled: Use the Numba-compiled simulation loop instead of vectorized
+            NumPy operations; requires Numba to be installed
+        chunk_size: Number of tickets drawn per vectorized chunk
+
+    Returns:
+        Number of tickets per match index
     """
-    print("\nProbability Analysis:")
-    print("-" * 95)
-    print(f"{'Match Type':<15} {'Expected':<10} {'Actual':<10} {'Diff %':<10} {'Within 2σ':<10}")
-    print("-" * 95)
+    rng = np.random.default_rng(seed_seq)
+    counts = np.zeros(len(MATCH_KEYS), dtype=np.int64)
+
+    if compiled:
+        seed = int(rng.integers(2**32))
+        _load_compiled()(num_tickets, winning_lut, winning_mega,
+                         MegaMillions.MEGA_BALL_MAX, seed, counts)
+    else:
+        _simulate_vectorized(num_tickets, winning_lut, winning_mega, rng, counts, chunk_size)
 
-    for match_type, data in win_summary.items():
-        _print_probability_row(match_type, data, num_tickets)
+    return counts
 
 
-def _print_probability_row(match_type: str, data: WinData, num_tickets: int) -> None:
+def simulate_tickets(num_tickets: int, winning_numbers: TicketNumbers,
+                     seed_seq: np.random.SeedSequence) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Print a single row of probability analysis.
+    Play random tickets against the winning numbers.
+
+    Simulations of at least COMPILED_MIN_TICKETS tickets use the Numba-compiled
+    simulation loop when Numba is installed; smaller ones, or all of them
+    without Numba, use vectorized NumPy operations.
+
+    Simulations of at least PARALLEL_MIN_TICKETS tickets (NumPy) or
+    PARALLEL_MIN_COMPILED_TICKETS tickets (compiled) are split into one batch
+    per CPU and run in worker processes, each with an independent random
+    stream spawned from seed_seq. On the NumPy path the workers split
+    BATCH_SIZE between them, so total memory use does not grow with the CPU
+    count; the compiled loop draws one ticket at a time and needs no chunks.
 
     Args:
-        match_type: Type of win being analyzed
-        data: Win statistics for this match type
-        num_tickets: Total number of tickets played
+        num_tickets: Number of tickets to play
+        winning_numbers: The winning numbers for the draw
+        seed_seq: Seed for the random number generators
+
+    Returns:
+        Tuple containing:
+            - Number of tickets per match index
+            - Total winnings per match index
     """
-    expected = num_tickets * data.odds
-    actual = data.count
-    std_dev = (num_tickets * data.odds * (1 - data.odds)) ** 0.5
-    diff_percent = ((actual - expected) / expected) * 100 if expected > 0 else 0
-    within_2sigma = abs(actual - expected) <= 2 * std_dev
+    winning_lut = build_winning_lut(winning_numbers[0])
+    compiled = num_tickets >= COMPILED_MIN_TICKETS and _load_compiled() is not None
+    parallel_min = PARALLEL_MIN_COMPILED_TICKETS if compiled else PARALLEL_MIN_TICKETS
+    workers = (os.cpu_count() or 1) if num_tickets >= parallel_min else 1
+
+    if workers == 1:
+        counts = simulate_batch(num_tickets, winning_lut, winning_numbers[1], seed_seq, compiled)
+    else:
+        batch_sizes = [num_tickets // workers + (i < num_tickets % workers) for i in range(workers)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(simulate_batch, batch_sizes, repeat(winning_lut),
+                                   repeat(winning_numbers[1]), seed_seq.spawn(workers),
+                                   repeat(compiled), repeat(max(1, BATCH_SIZE // workers)))
+            counts = np.zeros(len(MATCH_KEYS), dtype=np.int64)
+            for batch_counts in results:
+                counts += batch_counts
+
+    return counts, counts * np.frombuffer(PRIZE_LUT, dtype=np.int64)
+
+
+def format_summary(num_tickets: int, total_spent: float, total_won: int) -> str:
+    """
+    Format a summary of the simulation results.
+
+    Args:
+        num_tickets: Number of tickets played
+        total_spent: Total money spent on tickets
+        total_won: Total prize money won
 
-    print(f"{match_type:<15} {expected:>9.1f} {actual:>9} {diff_percent:>9.1f}% {'Yes' if within_2sigma else 'No':>9}")
+    Returns:
+        Multi-line summary text
+    """
+    return (f"\nResults Summary:\n"
+            f"Total tickets purchased: {num_tickets}\n"
+            f"Total spent: ${total_spent:.2f}\n"
+            f"Total won: ${total_won:,}\n"
+            f"Net profit/loss: ${(total_won - total_spent):,.2f}\n"
+            f"Return on spend: {(total_won / total_spent * 100):.2f}%")
+
+
+def format_probability_analysis(counts: np.ndarray, odds: np.ndarray, num_tickets: int) -> str:
+    """
+    Format statistical analysis comparing actual vs expected wins.
+
+    Args:
+        counts: Number of winning tickets per prize tier
+        odds: Probability of winning each prize tier
+        num_tickets: Number of tickets played
+
+    Returns:
+        Multi-line table with one row per prize tier
+    """
+    expected = num_tickets * odds
+    std_dev = np.sqrt(num_tickets * odds * (1 - odds))
+    diff_percent = np.divide((counts - expected) * 100, expected,
+                             out=np.zeros_like(expected), where=expected > 0)
+    within_2sigma = np.abs(counts - expected) <= 2 * std_dev
+
+    rows = "\n".join(
+        _ROW_FORMAT.format(match_type, expected[tier], counts[tier], diff_percent[tier],
+                           "Yes" if within_2sigma[tier] else "No")
+        for tier, match_type in enumerate(TIER_NAMES)
+    )
+    return "\n".join(["\nProbability Analysis:", _SEPARATOR, _HEADER, _SEPARATOR, rows])
 
 
 def main() -> None:
@@ -210,35 +476,25 @@ def main() -> None:
     with statistical analysis.
     """
     try:
-        random.seed(os.urandom(8))
+        seed_seq = np.random.SeedSequence(int.from_bytes(os.urandom(8), "little"))
         logger.info("Starting Mega Millions simulation")
 
         game = MegaMillions()
         num_tickets = 10
         total_spent = num_tickets * game.ticket_cost
-        total_won = 0
-        win_summary = initialize_win_summary()
 
         winning_numbers = game.generate_numbers()
-        print(f"\nMega Millions Simulator - {num_tickets} Tickets")
-        print(f"Winning numbers: {winning_numbers[0]} Mega Ball: {winning_numbers[1]}")
-
-        for _ in range(num_tickets):
-            ticket = game.generate_numbers()
-            prize = game.check_win(ticket, winning_numbers)
-            total_won += prize
-
-            if prize > 0:
-                match_desc = game.get_match_description(ticket, winning_numbers)
-                key = match_desc if "Mega Ball only" in match_desc else (
-                    "5 + Mega Ball" if "5" in match_desc and "Mega Ball" in match_desc
-                    else match_desc.split()[0] + (" + Mega Ball" if "Mega Ball" in match_desc else "")
-                )
-                win_summary[key].count += 1
-                win_summary[key].total += prize
-
-        print_summary(num_tickets, total_spent, total_won)
-        print_probability_analysis(win_summary, num_tickets)
+
+        match_counts, match_totals = simulate_tickets(num_tickets, winning_numbers, seed_seq)
+        counts = match_counts[TIER_MATCH_INDEX]
+        total_won = int(match_totals.sum())
+
+        sys.stdout.write("\n".join([
+            f"\nMega Millions Simulator - {num_tickets} Tickets",
+            f"Winning numbers: {game.white_balls(winning_numbers[0])} Mega Ball: {winning_numbers[1]}",
+            format_summary(num_tickets, total_spent, total_won),
+            format_probability_analysis(counts, tier_odds(), num_tickets),
+        ]) + "\n")
 
         logger.info("Simulation completed successfully")
     except Exception as e:
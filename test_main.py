@@ -0,0 +1,114 @@
+"""
+Consistency checks for the Mega Millions simulator.
+
+The scalar MegaMillions API, the vectorized NumPy simulation and the
+Numba-compiled simulation each draw and score tickets independently. These
+tests play a fixed-seed batch through each one and compare the resulting
+match index distribution against the exact combinatorial odds.
+
+Run with ``python -m unittest``.
+"""
+
+import unittest
+from math import comb, sqrt
+
+import numpy as np
+
+import main
+
+NUM_TICKETS = 200_000
+# Winning draw using the highest white ball and Mega Ball, so an off-by-one
+# upper bound in any sampler shows up as a missing match
+WINNING_BALLS = [3, 17, 28, 45, 70]
+WINNING_MEGA = 25
+
+
+def exact_match_probabilities() -> np.ndarray:
+    """
+    Compute the exact probability of each match index.
+
+    Returns:
+        Probability of each ``white_matches * 2 + mega_match`` index
+    """
+    white_count = main.MegaMillions.WHITE_BALL_MAX - 1
+    mega_count = main.MegaMillions.MEGA_BALL_MAX - 1
+    probabilities = np.zeros(len(main.MATCH_KEYS))
+    for white_matches in range(6):
+        white_p = comb(5, white_matches) * comb(white_count - 5, 5 - white_matches) / comb(white_count, 5)
+        probabilities[white_matches * 2] = white_p * (mega_count - 1) / mega_count
+        probabilities[white_matches * 2 + 1] = white_p / mega_count
+    return probabilities
+
+
+class SimulationConsistencyTest(unittest.TestCase):
+    """Checks that every simulation path agrees with the exact odds."""
+
+    def setUp(self) -> None:
+        self.white_mask = sum(1 << ball for ball in WINNING_BALLS)
+        self.winning_lut = main.build_winning_lut(self.white_mask)
+
+    def assert_matches_odds(self, counts: np.ndarray) -> None:
+        """Assert each match index count is within 5 sigma of its expected value."""
+        self.assertEqual(counts.sum(), NUM_TICKETS)
+        for index, p in enumerate(exact_match_probabilities()):
+            expected = NUM_TICKETS * p
+            tolerance = 5 * sqrt(NUM_TICKETS * p * (1 - p)) + 1
+            self.assertLessEqual(abs(counts[index] - expected), tolerance,
+                                 f"match index {index}: {counts[index]} vs {expected:.1f}")
+
+    def test_odds_table_matches_exact_odds(self) -> None:
+        exact = exact_match_probabilities()
+        for index, odds in enumerate(main.ODDS_LUT):
+            if odds > 0:
+                # The official odds are published rounded to "1 in N"
+                self.assertAlmostEqual(odds / exact[index], 1, delta=0.02)
+
+    def test_scalar_match_index(self) -> None:
+        game = main.MegaMillions()
+        game._rand.seed(1234)
+        game.set_winning((self.white_mask, WINNING_MEGA))
+        counts = np.zeros(len(main.MATCH_KEYS), dtype=np.int64)
+        for _ in range(NUM_TICKETS):
+            counts[game.match_index(game.generate_numbers())] += 1
+        self.assert_matches_odds(counts)
+
+    def test_vectorized_simulation(self) -> None:
+        counts = np.zeros(len(main.MATCH_KEYS), dtype=np.int64)
+        rng = np.random.default_rng(np.random.SeedSequence(1234))
+        main._simulate_vectorized(NUM_TICKETS, self.winning_lut, WINNING_MEGA, rng, counts)
+        self.assert_matches_odds(counts)
+
+    def test_compiled_simulation(self) -> None:
+        compiled = main._load_compiled()
+        if compiled is None:
+            self.skipTest("Numba is not installed")
+        counts = np.zeros(len(main.MATCH_KEYS), dtype=np.int64)
+        compiled(NUM_TICKETS, self.winning_lut, WINNING_MEGA,
+                 main.MegaMillions.MEGA_BALL_MAX, 1234, counts)
+        self.assert_matches_odds(counts)
+
+    def test_simulate_tickets_totals(self) -> None:
+        counts, totals = main.simulate_tickets(1_000, (self.white_mask, WINNING_MEGA),
+                                               np.random.SeedSequence(1234))
+        self.assertEqual(counts.sum(), 1_000)
+        np.testing.assert_array_equal(totals, counts * np.array(main.PRIZE_LUT))
+
+
+class MegaMillionsTest(unittest.TestCase):
+    """Checks the scalar ticket API."""
+
+    def test_check_win_requires_set_winning(self) -> None:
+        game = main.MegaMillions()
+        with self.assertRaises(RuntimeError):
+            game.check_win(game.generate_numbers())
+
+    def test_jackpot(self) -> None:
+        game = main.MegaMillions()
+        ticket = game.generate_numbers()
+        game.set_winning(ticket)
+        self.assertEqual(game.check_win(ticket), main.JACKPOT_AMOUNT)
+        self.assertEqual(game.get_match_description(ticket), "5 numbers + Mega Ball")
+
+
+if __name__ == "__main__":
+    unittest.main()